@@ -3,7 +3,8 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
-import importlib
+import importlib.util
+import os
 
 import click
 from rich.console import Console
@@ -13,6 +14,13 @@ from server_manager.webservice.logger import LOG_CONFIG
 
 console = Console()
 
+# libuv-backed event loop when available (not on Windows), stdlib asyncio otherwise
+_EVENT_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+# C http parser when available, pure python h11 otherwise
+_HTTP_PROTOCOL = "httptools" if importlib.util.find_spec("httptools") else "h11"
+# import string so uvicorn can load the app in every worker process
+_APP_IMPORT = "server_manager.webservice.webservice:app"
+
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]}, invoke_without_command=True)
 @click.version_option(version=__version__, prog_name="server_manager")
@@ -21,6 +29,14 @@ def server_manager(ctx) -> None:
     if not ctx.invoked_subcommand:
         import uvicorn
 
-        mod = importlib.import_module("server_manager.webservice.webservice")
-        app = mod.app
-        uvicorn.run(app, log_config=LOG_CONFIG, host="0.0.0.0", port=8000)
+        uvicorn.run(
+            _APP_IMPORT,
+            log_config=LOG_CONFIG,
+            host="0.0.0.0",
+            port=8000,
+            loop=_EVENT_LOOP,
+            http=_HTTP_PROTOCOL,
+            workers=int(os.environ.get("SM_WORKERS", "1")),
+            # one formatted log line per request, only worth it while developing
+            access_log=os.environ.get("SM_ENV") == "DEV",
+        )
@@ -130,7 +130,6 @@ class Subscription:
             # Stream new logs
             async for line in streaming_api.stream_logs(container_name, f"tenant-{UsersReadQL.to_pydantic(info.context.user).id}", tail=1, follow=True):
                 yield line
-                await asyncio.sleep(0.1)
         except asyncio.CancelledError:
             sm_logger.debug(f"Log subscription for container {container_name} was cancelled.")
 
@@ -41,7 +41,6 @@ class DockerStreamingAPI(ControllerStreamingInterface):
                     # Stream logs continuously
                     async for line in container.log(stdout=True, stderr=True, follow=True, tail=tail):
                         yield line
-                        await asyncio.sleep(0)
                 else:
                     # Get historical logs
                     logs = await container.log(stdout=True, stderr=True, tail=tail)
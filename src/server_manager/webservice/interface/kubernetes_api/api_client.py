@@ -0,0 +1,12 @@
+from functools import cache
+
+from kubernetes import client
+
+
+@cache
+def shared_api_client() -> client.ApiClient:
+    """One ApiClient, and its connection pool, shared by every Kubernetes backend instance in this process.
+
+    Built on first use, after the backend has loaded its configuration and after any worker fork.
+    """
+    return client.ApiClient()
@@ -6,6 +6,7 @@ from kubernetes.stream import stream
 
 from server_manager.webservice.db_models import ServersCreate, Templates
 from server_manager.webservice.interface.interface import ControllerContainerInterface
+from server_manager.webservice.interface.kubernetes_api.api_client import shared_api_client
 from server_manager.webservice.logger import sm_logger
 from server_manager.webservice.util.data_access import DB
 # Default namespace for game servers
@@ -40,15 +41,15 @@ class KubernetesContainerAPI(ControllerContainerInterface):
 
     def _get_custom_objects_api(self) -> client.CustomObjectsApi:
         """Get the CustomObjectsApi client for CRD operations."""
-        return client.CustomObjectsApi()
+        return client.CustomObjectsApi(shared_api_client())
 
     def _get_core_api(self) -> client.CoreV1Api:
         """Get the CoreV1Api client for pod operations."""
-        return client.CoreV1Api()
+        return client.CoreV1Api(shared_api_client())
 
     def _get_apps_api(self) -> client.AppsV1Api:
         """Get the AppsV1Api client for deployment operations."""
-        return client.AppsV1Api()
+        return client.AppsV1Api(shared_api_client())
 
     @override
     async def start(self, container_name: str, namespace: str) -> bool:
@@ -417,9 +418,11 @@ class KubernetesContainerAPI(ControllerContainerInterface):
             pod_name = pod.metadata.name
             sm_logger.debug(f"Found pod {pod_name} for game server {container_name}")
             sm_logger.debug(f"Executing command on {container_name}: {command}")
-            # Attach to the main process and write command to stdin
+            # Attach to the main process and write command to stdin. stream() swaps api_client.request for a
+            # websocket call while it runs, so the attach gets a client of its own instead of the shared one
+            attach_api = client.CoreV1Api(client.ApiClient())
             resp = stream(
-                core_api.connect_get_namespaced_pod_attach,
+                attach_api.connect_get_namespaced_pod_attach,
                 pod_name,
                 namespace or DEFAULT_NAMESPACE,
                 container=container_name,
@@ -1,7 +1,8 @@
 import asyncio
+import time
 from collections.abc import AsyncGenerator
 from concurrent.futures import ThreadPoolExecutor
-from queue import Empty, Queue
+from contextlib import suppress
 from threading import Event
 from typing import Any, cast, override
 
@@ -9,11 +10,14 @@ from kubernetes import client, config, watch
 from kubernetes.client.exceptions import ApiException
 
 from server_manager.webservice.interface.interface import ControllerStreamingInterface
+from server_manager.webservice.interface.kubernetes_api.api_client import shared_api_client
 from server_manager.webservice.logger import sm_logger
 from server_manager.webservice.models import Metrics
 
 # Default namespace for game servers
 CRD_INSTANCES_NAMESPACE = "game-servers"
+# How long a resolved pod name is reused before listing pods again
+POD_CACHE_TTL = 5.0
 
 
 class KubernetesStreamingAPI(ControllerStreamingInterface):
@@ -33,17 +37,27 @@ class KubernetesStreamingAPI(ControllerStreamingInterface):
             except config.ConfigException as e:
                 sm_logger.error(f"Failed to load Kubernetes configuration: {e}")
                 raise
+        # (container_name, namespace) -> (pod_name, resolved_at)
+        self._pod_cache: dict[tuple[str, str], tuple[str, float]] = {}
 
     def _get_core_api(self) -> client.CoreV1Api:
         """Get the CoreV1Api client for pod operations."""
-        return client.CoreV1Api()
+        return client.CoreV1Api(shared_api_client())
 
     def _get_custom_objects_api(self) -> client.CustomObjectsApi:
         """Get the CustomObjectsApi client for metrics."""
-        return client.CustomObjectsApi()
+        return client.CustomObjectsApi(shared_api_client())
+
+    def _forget_pod(self, container_name: str, namespace: str) -> None:
+        """Drop a cached pod name so the next lookup lists pods again, e.g. after the pod was replaced."""
+        self._pod_cache.pop((container_name, namespace), None)
 
     async def _find_pod(self, container_name: str, namespace: str) -> str | None:
         """Find the pod name for a given container/deployment name."""
+        key = (container_name, namespace)
+        cached = self._pod_cache.get(key)
+        if cached and time.monotonic() - cached[1] < POD_CACHE_TTL:
+            return cached[0]
         try:
             core_api = self._get_core_api()
             loop = asyncio.get_event_loop()
@@ -55,7 +69,10 @@ class KubernetesStreamingAPI(ControllerStreamingInterface):
                 ),
             )
             if pods.items:
-                return pods.items[0].metadata.name
+                pod_name = pods.items[0].metadata.name
+                self._pod_cache[key] = (pod_name, time.monotonic())
+                return pod_name
+            self._forget_pod(container_name, namespace)
             return None
         except ApiException as e:
             sm_logger.error(f"Failed to find pod for {container_name}: {e}")
@@ -77,10 +94,16 @@ class KubernetesStreamingAPI(ControllerStreamingInterface):
 
         try:
             if follow:
-                # Use a queue + thread to avoid blocking the event loop
-                log_queue: Queue[str | None] = Queue()
+                # The blocking watch runs in a thread and hands each line to the event loop as it arrives
+                loop = asyncio.get_running_loop()
+                log_queue: asyncio.Queue[str | None] = asyncio.Queue()
                 stop_event = Event()
 
+                def put_line(line: str | None) -> None:
+                    # the loop may already be closed if the consumer went away first
+                    with suppress(RuntimeError):
+                        loop.call_soon_threadsafe(log_queue.put_nowait, line)
+
                 def watch_logs() -> None:
                     """Run the blocking watch in a separate thread."""
                     w = watch.Watch()
@@ -96,33 +119,23 @@ class KubernetesStreamingAPI(ControllerStreamingInterface):
                         ):
                             if stop_event.is_set():
                                 break
-                            log_queue.put(str(line) + "\n")
+                            put_line(str(line) + "\n")
                     except Exception as e:
+                        # the pod may have been replaced mid-stream
+                        self._forget_pod(container_name, ns)
                         sm_logger.error(f"Watch thread error: {e}")
                     finally:
                         w.stop()
-                        log_queue.put(None)  # Signal end of stream
+                        put_line(None)  # Signal end of stream
 
                 # Start the watch in a thread
-                loop = asyncio.get_event_loop()
                 executor = ThreadPoolExecutor(max_workers=1)
                 future = loop.run_in_executor(executor, watch_logs)
 
                 try:
-                    while True:
-                        try:
-                            # Non-blocking check with timeout
-                            line = await asyncio.wait_for(
-                                loop.run_in_executor(None, lambda: log_queue.get(timeout=0.1)),
-                                timeout=0.5,
-                            )
-                            if line is None:  # End of stream
-                                break
-                            yield line
-                        except (Empty, asyncio.TimeoutError):
-                            # No data yet, yield control and continue
-                            await asyncio.sleep(0.01)
-                            continue
+                    # one message per log line, woken as soon as the thread queues it
+                    while (line := await log_queue.get()) is not None:
+                        yield line
                 except asyncio.CancelledError:
                     sm_logger.debug(f"Log stream for {container_name} was cancelled")
                     stop_event.set()
@@ -145,6 +158,8 @@ class KubernetesStreamingAPI(ControllerStreamingInterface):
                 if logs:
                     yield logs
         except ApiException as e:
+            # the pod may have been replaced, resolve it again next time
+            self._forget_pod(container_name, ns)
             sm_logger.error(f"Failed to stream logs for {container_name}: {e}")
 
     @override
@@ -200,6 +215,8 @@ class KubernetesStreamingAPI(ControllerStreamingInterface):
                         )
 
                 except ApiException as e:
+                    # the pod may have been replaced, resolve it again on the next subscribe
+                    self._forget_pod(container_name, ns)
                     if e.status == 404:
                         sm_logger.debug(f"Metrics not yet available for {pod_name}")
                     else:
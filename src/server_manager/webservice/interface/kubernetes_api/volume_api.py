@@ -13,6 +13,7 @@ from kubernetes.client.exceptions import ApiException
 from paramiko import SFTPClient
 
 from server_manager.webservice.interface.interface import ControllerVolumeInterface, DirList
+from server_manager.webservice.interface.kubernetes_api.api_client import shared_api_client
 from server_manager.webservice.logger import sm_logger
 
 # Default namespace for game servers crds
@@ -55,11 +56,11 @@ class KubernetesVolumeAPI(ControllerVolumeInterface):
 
     def _get_custom_objects_api(self) -> client.CustomObjectsApi:
         """Get the CustomObjectsApi client for CRD operations."""
-        return client.CustomObjectsApi()
+        return client.CustomObjectsApi(shared_api_client())
 
     def _get_core_api(self) -> client.CoreV1Api:
         """Get the CoreV1Api client for pod operations."""
-        return client.CoreV1Api()
+        return client.CoreV1Api(shared_api_client())
 
     @contextmanager
     def _get_sftp_connection(self, host: str, user: str, password: str, port: int) -> Generator[SFTPClient, None, None]:
@@ -1,9 +1,44 @@
+import copy
 import logging
 import logging.config
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from rich.logging import RichHandler
 
 from server_manager.webservice.util.singleton import SingletonMeta
 
+
+class QueuedRichHandler(QueueHandler):
+    """RichHandler behind a queue, the console write happens on a listener thread instead of the caller"""
+
+    def __init__(self, **rich_kwargs):
+        super().__init__(queue.SimpleQueue())
+        self._target = RichHandler(**rich_kwargs)
+        self._listener = QueueListener(self.queue, self._target, respect_handler_level=True)
+        self._listener.start()
+
+    def setFormatter(self, fmt):  # noqa: N802
+        # formatting (and rich tracebacks) happen in the target handler
+        self._target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # only snapshot the message, keep exc_info so rich can still render the traceback
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def close(self):
+        # stop() drains whatever is still queued, close() can run again from logging.shutdown
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            self._target.close()
+        super().close()
+
+
 LOG_CONFIG = {
     "version": 1,
     "disable_existing_loggers": True,
@@ -20,7 +55,7 @@ LOG_CONFIG = {
         "default": {
             "level": "NOTSET",
             "formatter": "standard",
-            "class": "rich.logging.RichHandler",
+            "()": QueuedRichHandler,
             "rich_tracebacks": True,
             "markup": False,
             "show_time": True,
@@ -31,7 +66,7 @@ LOG_CONFIG = {
         "sqlalchemy": {
             "level": "NOTSET",
             "formatter": "sqlalchemy",
-            "class": "rich.logging.RichHandler",
+            "()": QueuedRichHandler,
             "rich_tracebacks": True,
             "markup": False,
             "show_time": True,
@@ -22,6 +22,10 @@ class StringToIDMapModel(BaseModel):
     items: dict[str, int]
 
 
+class MessageModel(BaseModel):
+    message: str
+
+
 ## Servers
 class ServerListResponse(StringToIDMapModel):
     pass
@@ -116,6 +120,10 @@ class TokenPair(BaseModel):
     refresh_token: Token
 
 
+class AccessTokenResponse(BaseModel):
+    access_token: str
+
+
 class TokenData(BaseModel):
     username: str
     expires_at: int
@@ -148,6 +156,10 @@ class NodeListResponse(StringToIDMapModel):
     pass
 
 
+class NodeDeleteResponse(SuccessModel):
+    error: str | None = None
+
+
 class AuthPingResponse(BaseModel):
     recieved_at: int
 
@@ -8,12 +8,11 @@ Author: Nathan Swanson
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Security
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Security
 from fastapi.security import OAuth2PasswordRequestForm
 
 from server_manager.webservice.db_models import Users, UsersBase
-from server_manager.webservice.models import CreateUserRequest
+from server_manager.webservice.models import AccessTokenResponse, CreateUserRequest, MessageModel
 from server_manager.webservice.util.auth import (
     auth_aquire_token,
     auth_get_active_user,
@@ -33,7 +32,7 @@ async def create_user_account(create_user_request: CreateUserRequest):
     )
 
 
-@router.delete("/", response_model=dict)
+@router.delete("/", response_model=MessageModel)
 async def delete_user_account(
     current_user: Annotated[Users, Security(auth_get_active_user, scopes=["management.delete_user"])],
     db: Annotated[DB, Depends(get_db)],
@@ -42,17 +41,16 @@ async def delete_user_account(
     # delete user from db
     assert current_user.id is not None
     db.delete_user(current_user.id)
-    return {"message": "User deleted successfully"}
+    return MessageModel(message="User deleted successfully")
 
 
-@router.post("/refresh")
-async def refresh_token(request: Request):
+@router.post("/refresh", response_model=AccessTokenResponse)
+async def refresh_token(request: Request, response: Response):
     """refresh access token using refresh token"""
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
         raise HTTPException(status_code=401, detail="No refresh token")
     new_tokens = await auth_renew_token(refresh_token)  # set new access token in cookie
-    response = JSONResponse({"access_token": new_tokens.access_token.token})
     response.set_cookie(
         key="refresh_token",
         value=new_tokens.refresh_token.token,
@@ -62,14 +60,13 @@ async def refresh_token(request: Request):
         max_age=new_tokens.refresh_token.expires_in,
         # path="/",
     )
-    return response
+    return AccessTokenResponse(access_token=new_tokens.access_token.token)
 
 
-@router.post("/token")
-async def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
+@router.post("/token", response_model=AccessTokenResponse)
+async def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], response: Response):
     """login user, return access token and set refresh token to cookie"""
     tokens = await auth_aquire_token(form_data)
-    response = JSONResponse({"access_token": tokens.access_token.token})
     response.set_cookie(
         key="refresh_token",
         value=tokens.refresh_token.token,
@@ -79,18 +76,20 @@ async def login_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()])
         max_age=tokens.refresh_token.expires_in,
         # path="/",
     )
-    return response
+    return AccessTokenResponse(access_token=tokens.access_token.token)
 
 
-@router.post("/revoke")
-async def logout_user(current_user: Annotated[Users, Depends(auth_get_active_user)]):  # noqa: ARG001
+@router.post("/revoke", response_model=MessageModel)
+async def logout_user(
+    current_user: Annotated[Users, Depends(auth_get_active_user)],  # noqa: ARG001
+    response: Response,
+):
     """logout user, delete access token cookie"""
     # return response with message
     # TODO: implement token revocation
-    response = JSONResponse({"message": "Logout successful"})
     response.set_cookie("refresh_token", "", max_age=0)
     response.delete_cookie("refresh_token")
-    return response
+    return MessageModel(message="Logout successful")
 
 
 @router.get("/me", response_model=UsersBase)
@@ -14,7 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from server_manager.webservice.db_models import NodesCreate, NodesRead
 from server_manager.webservice.logger import sm_logger
-from server_manager.webservice.models import NodeDiskUsageResponse, NodeUptimeResponse
+from server_manager.webservice.models import NodeDeleteResponse, NodeDiskUsageResponse, NodeUptimeResponse
 from server_manager.webservice.util.data_access import DB, get_db
 
 router = APIRouter()
@@ -45,10 +45,10 @@ def get_node(
     return ret
 
 
-@router.delete("/{node_id}")
-def delete_node(node_id: int) -> dict:  # noqa: ARG001
+@router.delete("/{node_id}", response_model=NodeDeleteResponse)
+def delete_node(node_id: int) -> NodeDeleteResponse:  # noqa: ARG001
     """delete a node by name"""
-    return {"success": False, "error": "Not implemented"}
+    return NodeDeleteResponse(success=False, error="Not implemented")
 
 
 @router.get("/{node_id}/disk_usage", response_model=NodeDiskUsageResponse)
@@ -39,7 +39,6 @@ async def get_archive(
     db: Annotated[DB, Depends(get_db)],
     paths: str | None = None,
 ):
-    paths = "/" + paths.lstrip("/")
     actual_paths = ast.literal_eval(paths) if paths else None
     server = db.get_server(server_id)
     if not server:
@@ -48,9 +48,10 @@ def secure_scope(scope: list[str] | str, dependencies: list | None):
     """
     if isinstance(scope, str):
         scope = [scope]
-    ret: dict[str, list] = (
-        {"dependencies": Security(auth_get_active_user, scopes=scope)} if scope else oauth2_wrapper.copy()
-    )
+    # fresh list either way, extending a shallow copy would mutate the shared oauth2_wrapper
+    ret: dict[str, list] = {
+        "dependencies": [Security(auth_get_active_user, scopes=scope)] if scope else [*oauth2_wrapper["dependencies"]]
+    }
     if dependencies:
         ret["dependencies"].extend(dependencies)
     return ret
@@ -36,13 +36,34 @@ from server_manager.webservice.db_models import (
 )
 from server_manager.webservice.util.singleton import SingletonMeta
 
+# connection pool settings, one pool per worker process
+_POOL_SIZE = 10
+_POOL_MAX_OVERFLOW = 20
+_POOL_RECYCLE_SECONDS = 1800
+
 
 class DB(metaclass=SingletonMeta):
     def __init__(self, verbose: bool = False):
-        self._engine = create_engine(os.environ["SM_DB_CONNECTION"], echo=verbose)
+        # built by the first DB() call inside a worker (lifespan startup or a request), never at import,
+        # so no worker inherits a forked connection pool
+        url = sqlalchemy.make_url(os.environ["SM_DB_CONNECTION"])
+        pool_options: dict[str, Any] = {}
+        if url.get_backend_name() != "sqlite":
+            # QueuePool-only options, SQLite uses its own pool classes
+            pool_options = {
+                "pool_size": _POOL_SIZE,
+                "max_overflow": _POOL_MAX_OVERFLOW,
+                "pool_pre_ping": True,
+                "pool_recycle": _POOL_RECYCLE_SECONDS,
+            }
+        self._engine = create_engine(url, echo=verbose, **pool_options)
 
         SQLModel.metadata.create_all(self._engine)
 
+    def dispose(self):
+        """close all pooled connections"""
+        self._engine.dispose()
+
     def unused_port(self, count: int = 1) -> list[int] | None:
         with Session(self._engine) as session:
             all_ports = select(
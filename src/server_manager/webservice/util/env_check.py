@@ -3,46 +3,57 @@ import sys
 
 from colorama import Fore
 from fastapi import FastAPI
-from fastapi.routing import APIRoute
 
 from server_manager.webservice.logger import sm_logger
 
 
 def startup_info():
+    env = os.environ
+    is_dev = env.get("SM_ENV") == "DEV"
+    python_version = "{}.{}.{}".format(*sys.version_info[:3])
+    platform_name = os.uname().sysname
+
     sm_logger.info("Performing environment checks...")
     sm_logger.log_group(
         "Starting server-manager webservice",
         [
-            f"Python version: {sys.version.split()[0]}",
-            f"OS: {os.name}, Platform: {os.uname().sysname}",
+            f"Python version: {python_version}",
+            f"OS: {os.name}, Platform: {platform_name}",
             f"Process ID: {os.getpid()}",
-            f"Log Level: {os.environ.get('SM_LOG_LEVEL', 'INFO')} (SM_LOG_LEVEL)",
-            f"Log Path: {os.environ.get('SM_LOG_PATH', 'stdout')} (SM_LOG_PATH)",
-            f"Environment: {os.environ.get('SM_ENV', 'PROD')} (SM_ENV)",
-            f"Port Range: {os.environ.get('SM_PORT_START', '30000')}-{os.environ.get('SM_PORT_END', '30100')} (SM_PORT_START and SM_PORT_END)",
-            f"Kubernetes: {'Enabled' if os.environ.get('SM_K8S') == '1' else 'Disabled'} (SM_K8S)",
-            f"URL: {Fore.BLUE}{'https' if os.environ.get('SM_ENV') != 'DEV' else 'http'}://{os.environ.get('SM_API_BACKEND', 'localhost')}{Fore.RESET} (SM_API_BACKEND)",
+            f"Log Level: {env.get('SM_LOG_LEVEL', 'INFO')} (SM_LOG_LEVEL)",
+            f"Log Path: {env.get('SM_LOG_PATH', 'stdout')} (SM_LOG_PATH)",
+            f"Environment: {env.get('SM_ENV', 'PROD')} (SM_ENV)",
+            f"Port Range: {env.get('SM_PORT_START', '30000')}-{env.get('SM_PORT_END', '30100')} (SM_PORT_START and SM_PORT_END)",
+            f"Kubernetes: {'Enabled' if env.get('SM_K8S') == '1' else 'Disabled'} (SM_K8S)",
+            f"URL: {Fore.BLUE}{'http' if is_dev else 'https'}://{env.get('SM_API_BACKEND', 'localhost')}{Fore.RESET} (SM_API_BACKEND)",
         ],
     )
-    if os.environ.get("SM_ENV") == "DEV":
+    if is_dev:
         sm_logger.warning("Running in DEV mode, this is not recommended for production use.")
     check_mount_path()
 
 
-def check_mount_path():
-    mount_path = os.environ.get("SM_MOUNT_PATH", "/mnt/server_manager")
-    if not os.path.exists(mount_path):
+def check_mount_path() -> str:
+    # resolve symlinks and relative parts once, later readers of SM_MOUNT_PATH get the canonical path
+    mount_path = os.path.realpath(os.environ.get("SM_MOUNT_PATH", "/mnt/server_manager"))
+    # a real write is the only reliable check, os.access lies on NFS (root squash, ACLs)
+    probe_path = os.path.join(mount_path, ".sm_write_probe")
+    try:
         os.makedirs(mount_path, exist_ok=True)
-
-    if not os.access(mount_path, os.W_OK):
-        sm_logger.error(f"Mount path {mount_path} is not writable. Please check permissions.")
+        os.close(os.open(probe_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC))
+        os.unlink(probe_path)
+    except OSError as e:
+        sm_logger.error(f"Mount path {mount_path} is not writable ({e}). Please check permissions.")
         sys.exit(1)
     sm_logger.info(f"Mount path {mount_path} is valid and writable.")
+    os.environ["SM_MOUNT_PATH"] = mount_path
+    return mount_path
 
 
 def generate_operation_id(app: FastAPI):
     """Generate a unique operation ID"""
 
-    for route in app.routes:
-        if isinstance(route, APIRoute):
+    # only APIRoute declares operation_id, mounts and websocket routes are skipped
+    for route in app.router.routes:
+        if hasattr(route, "operation_id"):
             route.operation_id = route.name
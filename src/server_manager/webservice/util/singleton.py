@@ -16,3 +16,7 @@ class SingletonMeta(type):
         if cls not in cls._instances:
             cls._instances[cls] = super().__call__(*args, **kwargs)
         return cls._instances[cls]
+
+    def existing(cls):
+        """Return the instance if one was already created, without creating it"""
+        return cls._instances.get(cls)
@@ -7,11 +7,14 @@ Author: Nathan Swanson
 """
 
 import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
-from server_manager.webservice import graphql
 from server_manager.webservice.logger import sm_logger
 from server_manager.webservice.routes import (
     management_api,
@@ -22,17 +25,32 @@ from server_manager.webservice.routes import (
     volumes_api,
 )
 from server_manager.webservice.util.auth import auth_get_active_user
+from server_manager.webservice.util.data_access import DB
 from server_manager.webservice.util.dev import dev_startup
 from server_manager.webservice.util.env_check import generate_operation_id, startup_info
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    """run startup checks once the server starts, not at import"""
+    startup_info()
+    if os.environ.get("SM_ENV") == "DEV":
+        dev_startup()
+    yield
+    # the DB singleton is only created on first use, close its pool if this worker opened one
+    db = DB.existing()
+    if db is not None:
+        db.dispose()
+
+
 # main app
-app = FastAPI(root_path="/api")
+app = FastAPI(root_path="/api", lifespan=lifespan)
 # CORS middleware
-cors_allowed_origins = [
+cors_allowed_origins = (
     "https://admin.socket.io",
     "https://vite.localhost",
     f"https://{os.environ.get('SM_API_BACKEND')}",
-]
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_allowed_origins,
@@ -41,23 +59,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 sm_logger.debug("CORS allowed origins: %s", cors_allowed_origins)
-# routers
-app.include_router(
-    template_api.router, dependencies=[Depends(auth_get_active_user)], prefix="/templates", tags=["templates"]
+# compress list responses, small json bodies are sent as is. Volume downloads are already archives and set their
+# own Content-Length, which gzip would drop, so they pass through untouched
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=6,
+    exclude_content_types=(*DEFAULT_EXCLUDED_CONTENT_TYPES, "application/x-tar", "application/octet-stream"),
 )
-app.include_router(management_api.router, prefix="/users", tags=["users"])
-app.include_router(server_api.router, dependencies=[Depends(auth_get_active_user)], prefix="/servers", tags=["servers"])
-app.include_router(nodes_api.router, dependencies=[Depends(auth_get_active_user)], prefix="/nodes", tags=["nodes"])
-app.include_router(search_api.router, dependencies=[Depends(auth_get_active_user)], prefix="/search", tags=["search"])
-app.include_router(
-    volumes_api.router, dependencies=[Depends(auth_get_active_user)], prefix="/volumes", tags=["volumes"]
+# routers: (router, prefix, tags, requires an active user)
+_ROUTERS = (
+    (template_api.router, "/templates", ["templates"], True),
+    (management_api.router, "/users", ["users"], False),
+    (server_api.router, "/servers", ["servers"], True),
+    (nodes_api.router, "/nodes", ["nodes"], True),
+    (search_api.router, "/search", ["search"], True),
+    (volumes_api.router, "/volumes", ["volumes"], True),
 )
+_auth_dependencies = [Depends(auth_get_active_user)]
+for router, prefix, tags, requires_auth in _ROUTERS:
+    app.include_router(router, dependencies=_auth_dependencies if requires_auth else None, prefix=prefix, tags=tags)
+
 
+# graphql, imported lazily so deployments that disable it skip loading strawberry and the streaming client
+if os.environ.get("SM_ENABLE_GRAPHQL", "1") == "1":
+    from server_manager.webservice import graphql
 
-# graphql
-app.include_router(graphql.router, prefix="/graphql", tags=["graphql"])
+    app.include_router(graphql.router, prefix="/graphql", tags=["graphql"])
 
 
+# operation ids are part of the route definitions (openapi export, client codegen), so set them at import
 generate_operation_id(app)
-startup_info()
-dev_startup()
@@ -1,22 +1,21 @@
-import multiprocessing
-import os
-from collections.abc import Generator
-from typing import Any
+from functools import partial
+from types import SimpleNamespace
 
+import bcrypt
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
-from tests.mock_data import TEST_NODE_READ, TEST_TEMPLATE_READ, TEST_USER_READ
+from tests.mock_data import TEST_NODE_READ_MODEL, TEST_TEMPLATE_READ_MODEL, TEST_USER_READ_MODEL
 
 
-@pytest.fixture(scope="session")
-def app_instance() -> Generator[FastAPI, Any, Any]:
+@pytest.fixture(scope="session", autouse=True)
+def sm_environment():
     """
-    Session-scoped fixture to initialize the FastAPI application once.
-    Sets necessary environment variables before importing the app.
+    Session-scoped fixture setting the environment the app needs before any test runs.
+    bcrypt is dropped to its minimum cost so password hashing stays fast, everything is restored at teardown.
     """
-    # Set environment variables needed for app initialization with purge_env_vars
     vars_to_purge = [
         "SM_SECRET_KEY",
         "SM_CADDY_FILE",
@@ -29,52 +28,60 @@ def app_instance() -> Generator[FastAPI, Any, Any]:
         "SM_LOG_PATH",
         "SM_LOG_LEVEL",
         "SM_MOUNT_PATH",
+        "SM_ENABLE_GRAPHQL",
     ]
-
-    vars_to_save: dict[str, str] = {
+    vars_to_set: dict[str, str] = {
         "SM_API_BACKEND": "localhost",
         "SM_LOG_LEVEL": "DEBUG",
         "SM_LOG_PATH": "./sm-log.log",
         "SM_MOUNT_PATH": "./sm-data",
         "SM_SECRET_KEY": "testsecretkey",
+        "SM_ENABLE_GRAPHQL": "0",
     }
-    monkeypatch = pytest.MonkeyPatch()
-    original_env = {var: os.environ.get(var) for var in vars_to_purge}
-
-    for var in vars_to_purge:
-        monkeypatch.delenv(var, raising=False)
-    for var, value in vars_to_save.items():
-        monkeypatch.setenv(var, value)
-    # Import the app after setting the environment
-    from server_manager.webservice.webservice import app
+    with pytest.MonkeyPatch.context() as mp:
+        for var in vars_to_purge:
+            mp.delenv(var, raising=False)
+        for var, value in vars_to_set.items():
+            mp.setenv(var, value)
+        mp.setattr(bcrypt, "gensalt", partial(bcrypt.gensalt, rounds=4))
+        yield
 
-    yield app
-    for var, value in original_env.items():
-        if value is not None:
-            monkeypatch.setenv(var, value)
-        else:
-            monkeypatch.delenv(var, raising=False)
 
-    monkeypatch.undo()
+@pytest.fixture(scope="session")
+def app_instance(sm_environment) -> FastAPI:
+    """
+    Session-scoped fixture returning the FastAPI application.
+    Imported only once sm_environment is in place, the module reads SM_* variables at import.
+    """
+    from server_manager.webservice.webservice import app
+
+    return app
 
 
 @pytest.fixture
 def mock_db(mocker):
-    lock = multiprocessing.Lock()
-
     def _mock_db():
         mock_db_instance = mocker.MagicMock()
-        from server_manager.webservice.db_models import NodesRead, TemplatesRead, UsersRead
 
         # Configure default return values for common methods
-        mock_db_instance.get_node.return_value = NodesRead(**TEST_NODE_READ)
-        mock_db_instance.get_user.return_value = UsersRead(**TEST_USER_READ)
-        mock_db_instance.get_template.return_value = TemplatesRead(**TEST_TEMPLATE_READ)
+        mock_db_instance.get_node.return_value = TEST_NODE_READ_MODEL.model_copy()
+        mock_db_instance.get_user.return_value = TEST_USER_READ_MODEL.model_copy()
+        mock_db_instance.get_template.return_value = TEST_TEMPLATE_READ_MODEL.model_copy()
 
         return mock_db_instance
 
-    with lock:
-        yield _mock_db()
+    return _mock_db()
+
+
+@pytest.fixture
+def server_mock(mock_db):
+    """Factory that makes mock_db.get_server return a stand-in server, container "mc" with id 1 unless overridden"""
+
+    def _make(**fields):
+        mock_db.get_server.return_value = SimpleNamespace(**{"container_name": "mc", "id": 1, **fields})
+        return mock_db.get_server.return_value
+
+    return _make
 
 
 @pytest.fixture(scope="session")
@@ -88,15 +95,24 @@ def test_client(
         yield client
 
 
-@pytest.fixture(scope="session")
-def test_client_no_auth(app_instance: FastAPI):
+@pytest.fixture
+def test_client_no_auth(app_instance: FastAPI, test_client: TestClient):
     """
-    Session-scoped fixture to create a TestClient for the FastAPI application.
+    The shared TestClient with authentication overridden by the test user for one test only,
+    so tests using test_client afterwards still go through real authentication.
     """
-    from server_manager.webservice.db_models import UsersRead
     from server_manager.webservice.util.auth import auth_get_active_user
 
-    print(os.environ)
-    with TestClient(app_instance) as client:
-        app_instance.dependency_overrides[auth_get_active_user] = lambda: UsersRead(**TEST_USER_READ)
+    app_instance.dependency_overrides[auth_get_active_user] = lambda: TEST_USER_READ_MODEL
+    yield test_client
+    app_instance.dependency_overrides.pop(auth_get_active_user, None)
+
+
+@pytest.fixture
+async def async_client_no_auth(app_instance: FastAPI, test_client_no_auth: TestClient):
+    """
+    In-process async client with the same auth override as test_client_no_auth.
+    Requests run on the test's event loop instead of hopping through the TestClient portal thread.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app_instance), base_url="http://test") as client:
         yield client
@@ -1,3 +1,4 @@
+from server_manager.webservice.db_models import NodesRead, ServersRead, TemplatesRead, UsersRead
 from server_manager.webservice.routes.search_api import ServerFileListResponse
 
 TEST_USER = {"username": "testuser", "scopes": [""], "hashed_password": "hashed", "admin": False}
@@ -37,6 +38,12 @@ TEST_USER_READ = TEST_USER | {"id": 1}
 TEST_NODE_READ = TEST_NODE | {"id": 1}
 TEST_TEMPLATE_READ = TEST_TEMPLATE | {"id": 1}
 
+# validated once at import, use model_copy() where a test needs to change one
+TEST_SERVER_READ_MODEL = ServersRead(**TEST_SERVER_READ)
+TEST_USER_READ_MODEL = UsersRead(**TEST_USER_READ)
+TEST_NODE_READ_MODEL = NodesRead(**TEST_NODE_READ)
+TEST_TEMPLATE_READ_MODEL = TemplatesRead(**TEST_TEMPLATE_READ)
+
 MOCK_FILE_DATA: ServerFileListResponse = ServerFileListResponse(
     items=["file1.txt", "file2.txt", "folder1/", "folder2/"]
 )
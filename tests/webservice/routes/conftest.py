@@ -0,0 +1,28 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+
+from server_manager.webservice.interface.interface import ControllerVolumeInterface
+from server_manager.webservice.interface.interface_manager import get_volume_client
+
+
+@pytest.fixture(autouse=True)
+def _isolate_overrides(app_instance: FastAPI):
+    """
+    Snapshot the shared app's dependency overrides before each route test and restore them afterwards,
+    so overrides set inside a test never leak into the next one on the session-scoped client.
+    """
+    overrides = app_instance.dependency_overrides
+    snapshot = dict(overrides)
+    yield
+    overrides.clear()
+    overrides.update(snapshot)
+
+
+@pytest.fixture
+def volume_client(app_instance: FastAPI):
+    """Serve get_volume_client with an AsyncMock of the volume backend, _isolate_overrides removes it afterwards"""
+    client = AsyncMock(spec=ControllerVolumeInterface)
+    app_instance.dependency_overrides[get_volume_client] = lambda: client
+    return client
@@ -6,16 +6,39 @@ Tests for the management API
 Author: Nathan Swanson
 """
 
+import pytest
+
 from server_manager.webservice.db_models import Users
 from server_manager.webservice.models import Token
 from server_manager.webservice.util.auth import TokenPair, auth_get_active_user
 from server_manager.webservice.util.data_access import get_db
 
+_ACTIVE_USER = Users(
+    id=1,
+    username="testuser",
+    scopes=["management.me", "management.delete_user"],
+    hashed_password="password",
+)
+_CREATED_USER = Users(id=1, username="testuser", scopes=["management.me"], hashed_password="password")
+_CREATED_USER_JSON = {"username": "testuser", "disabled": True, "scopes": ["management.me"], "admin": False}
+_ACTIVE_USER_JSON = {
+    "username": "testuser",
+    "disabled": True,
+    "scopes": ["management.me", "management.delete_user"],
+    "admin": False,
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_active_user(app_instance):
+    """Authenticate every request in this module as one user holding all management scopes"""
+    app_instance.dependency_overrides[auth_get_active_user] = lambda: _ACTIVE_USER
+    return _ACTIVE_USER
+
 
 def test_create_user_account(mocker, test_client):
     """Test creating a user account"""
-    mock_user = Users(id=1, username="testuser", scopes=["management.me"], hashed_password="password")
-    mocker.patch("server_manager.webservice.routes.management_api.create_user", return_value=mock_user)
+    mocker.patch("server_manager.webservice.routes.management_api.create_user", return_value=_CREATED_USER)
 
     response = test_client.post(
         "/users/",
@@ -23,14 +46,12 @@ def test_create_user_account(mocker, test_client):
     )
 
     assert response.status_code == 200
-    assert response.json() == {"username": "testuser", "disabled": True, "scopes": ["management.me"], "admin": False}
+    assert response.json() == _CREATED_USER_JSON
 
 
 def test_delete_user_account(test_client, mock_db):
     """Test deleting a user account"""
-    mock_user = Users(id=1, username="testuser", scopes=["management.delete_user"], hashed_password="password")
     # Mock the dependency injection
-    test_client.app.dependency_overrides[auth_get_active_user] = lambda: mock_user
     test_client.app.dependency_overrides[get_db] = lambda: mock_db
 
     response = test_client.delete(
@@ -42,9 +63,6 @@ def test_delete_user_account(test_client, mock_db):
     assert response.json() == {"message": "User deleted successfully"}
     mock_db.delete_user.assert_called_once_with(1)
 
-    # Clean up dependency override
-    test_client.app.dependency_overrides = {}
-
 
 def test_login_user(mocker, test_client):
     """Test logging in a user"""
@@ -67,11 +85,6 @@ def test_login_user(mocker, test_client):
 
 def test_logout_user(test_client):
     """Test logging out a user"""
-    mock_user = Users(id=1, username="testuser", scopes=["management.me"], hashed_password="password")
-
-    # Mock the dependency injection
-    test_client.app.dependency_overrides[auth_get_active_user] = lambda: mock_user
-
     response = test_client.post(
         "/users/revoke",
         headers={"Authorization": "Bearer testtoken"},
@@ -80,24 +93,13 @@ def test_logout_user(test_client):
     assert response.status_code == 200
     assert response.json() == {"message": "Logout successful"}
 
-    # Clean up dependency override
-    test_client.app.dependency_overrides = {}
-
 
 def test_get_user(test_client):
     """Test getting user information"""
-    mock_user = Users(id=1, username="testuser", scopes=["management.me"], hashed_password="password")
-
-    # Mock the dependency injection
-    test_client.app.dependency_overrides[auth_get_active_user] = lambda: mock_user
-
     response = test_client.get(
         "/users/me",
         headers={"Authorization": "Bearer testtoken"},
     )
 
     assert response.status_code == 200
-    assert response.json() == {"username": "testuser", "disabled": True, "scopes": ["management.me"], "admin": False}
-
-    # Clean up dependency override
-    test_client.app.dependency_overrides = {}
+    assert response.json() == _ACTIVE_USER_JSON
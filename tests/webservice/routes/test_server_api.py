@@ -1,164 +1,114 @@
 from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
-from server_manager.webservice.db_models import ServersRead
-from tests.mock_data import TEST_SERVER, TEST_SERVER_READ
+from server_manager.webservice.interface.interface_manager import ControllerContainerInterface, get_container_client
+from server_manager.webservice.routes import server_api
+from tests.mock_data import TEST_SERVER, TEST_SERVER_READ, TEST_SERVER_READ_MODEL, TEST_USER_READ_MODEL
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def patch_db(mocker, mock_db):
-    mocker.patch("server_manager.webservice.routes.server_api.DB", return_value=mock_db)
-    mock_db.get_server_by_name.return_value = None
+    """Route the module's DB() calls to mock_db"""
+    mocker.patch.object(server_api, "DB", return_value=mock_db)
     return mock_db
 
 
-def test_create_server_success(test_client_no_auth, mock_db, mocker):
-    mock_db.get_template.return_value = SimpleNamespace(image="game", exposed_port=[3000])
-    mock_db.get_server_by_name.return_value = None
-    mock_db.unused_port.return_value = [4000]
-    mock_db.create_server.return_value = ServersRead(**TEST_SERVER_READ)
-    docker_create = mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_create",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
+@pytest.fixture
+def container_client(app_instance):
+    """Serve get_container_client with an AsyncMock of the container backend for one test"""
+    client = AsyncMock(spec=ControllerContainerInterface)
+    app_instance.dependency_overrides[get_container_client] = lambda: client
+    return client
+
+
+def test_create_server_success(test_client_no_auth, patch_db, container_client):
+    patch_db.get_template.return_value = SimpleNamespace(image="game", exposed_port=[3000])
+    patch_db.get_server_by_name.return_value = None
+    patch_db.create_server.return_value = TEST_SERVER_READ_MODEL
 
     response = test_client_no_auth.post("/servers/", json=TEST_SERVER)
 
     assert response.status_code == 200
     assert response.json()["id"] == TEST_SERVER_READ["id"]
-    docker_create.assert_awaited()
-    mock_db.create_server.assert_called_once()
+    container_client.create.assert_awaited_once()
+    assert container_client.create.await_args.kwargs["tenant_id"] == TEST_USER_READ_MODEL.id
+    patch_db.create_server.assert_called_once()
 
 
-def test_create_server_duplicate_name_returns_400(test_client_no_auth, mock_db):
-    mock_db.get_server_by_name.return_value = ServersRead(**TEST_SERVER_READ)
+def test_create_server_duplicate_name_returns_400(test_client_no_auth, patch_db, container_client):
+    patch_db.get_server_by_name.return_value = TEST_SERVER_READ_MODEL
 
     response = test_client_no_auth.post("/servers/", json=TEST_SERVER)
 
     assert response.status_code == 400
     assert response.json()["detail"] == "Server with that name already exists"
+    container_client.create.assert_not_awaited()
 
 
-def test_create_server_fails_when_docker_errors(test_client_no_auth, mock_db, mocker):
-    mock_db.get_template.return_value = SimpleNamespace(image="game", exposed_port=[3000])
-    mock_db.get_server_by_name.return_value = None
-    mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_create",
-        new_callable=mocker.AsyncMock,
-        return_value=False,
-    )
-
-    response = test_client_no_auth.post("/servers/", json=TEST_SERVER)
-
-    assert response.status_code == 500
-    assert response.json()["detail"] == "Failed to create Docker container"
-
-
-def test_create_server_returns_false_when_template_missing(test_client_no_auth, mock_db):
-    mock_db.get_template.return_value = None
-    mock_db.get_server_by_name.return_value = None
+def test_create_server_returns_false_when_template_missing(test_client_no_auth, patch_db, container_client):
+    patch_db.get_template.return_value = None
+    patch_db.get_server_by_name.return_value = None
 
     response = test_client_no_auth.post("/servers/", json=TEST_SERVER)
 
     assert response.status_code == 404
     assert response.json()["detail"] == "Template not found"
+    container_client.create.assert_not_awaited()
 
 
-def test_delete_server_removes_container_and_record(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc", id=1)
-    mock_db.delete_server.return_value = True
-    docker_remove = mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_remove",
-        new_callable=mocker.AsyncMock,
-    )
+def test_delete_server_removes_container_and_record(test_client_no_auth, patch_db, server_mock, container_client):
+    server_mock()
+    patch_db.delete_server.return_value = True
 
     response = test_client_no_auth.delete("/servers/1")
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
-    docker_remove.assert_awaited_once_with("mc")
-    mock_db.delete_server.assert_called_once_with(1)
+    container_client.remove.assert_awaited_once_with("mc", namespace="game-servers")
+    patch_db.delete_server.assert_called_once_with(1)
 
 
-def test_delete_server_missing_returns_error(test_client_no_auth, mock_db):
-    mock_db.get_server.return_value = None
-    mock_db.delete_server.return_value = False
+@pytest.mark.parametrize(
+    ("method", "url", "params", "status_code", "expected"),
+    [
+        ("delete", "/servers/1", None, 200, {"success": False}),
+        ("post", "/servers/1/start", None, 200, {"success": False}),
+        ("post", "/servers/1/stop", None, 200, {"success": False}),
+        ("get", "/servers/1/status", None, 200, {"running": False, "health": None}),
+        ("post", "/servers/1/command", {"command": "say hi"}, 404, {"detail": "Server not found"}),
+    ],
+    ids=["delete", "start", "stop", "status", "command"],
+)
+def test_missing_server_returns_error(
+    test_client_no_auth, patch_db, container_client, method, url, params, status_code, expected
+):
+    patch_db.get_server.return_value = None
+    patch_db.delete_server.return_value = False
 
-    response = test_client_no_auth.delete("/servers/1")
+    response = test_client_no_auth.request(method, url, params=params)
 
-    assert response.status_code == 200
-    assert response.json() == {"success": False}
+    assert response.status_code == status_code
+    assert response.json() == expected
 
 
-def test_start_server_opens_ports(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc", id=1)
-    mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_start",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
-    mock_router = mocker.patch("server_manager.webservice.routes.server_api.ServerRouter")
-    mock_router_instance = mock_router.return_value
-    mock_router_instance.open_ports = mocker.AsyncMock()
+@pytest.mark.parametrize("action", ["start", "stop"])
+def test_start_stop_server_forwards_to_client(test_client_no_auth, patch_db, server_mock, container_client, action):
+    server_mock()
+    getattr(container_client, action).return_value = True
 
-    response = test_client_no_auth.post("/servers/1/start")
+    response = test_client_no_auth.post(f"/servers/1/{action}")
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
-    mock_router_instance.open_ports.assert_awaited_once()
+    getattr(container_client, action).assert_awaited_once_with("mc", namespace="game-servers")
 
 
-def test_start_server_missing_returns_error(test_client_no_auth, mock_db):
-    mock_db.get_server.return_value = None
-
-    response = test_client_no_auth.post("/servers/1/start")
-
-    assert response.status_code == 200
-    assert response.json() == {"success": False}
-
-
-def test_stop_server_closes_ports(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc", id=1)
-    mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_stop",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
-    mock_router = mocker.patch(
-        "server_manager.webservice.routes.server_api.ServerRouter",
-        return_value=SimpleNamespace(close_ports=mocker.MagicMock(), open_ports=mocker.MagicMock()),
-    )
-
-    response = test_client_no_auth.post("/servers/1/stop")
-
-    assert response.status_code == 200
-    assert response.json() == {"success": True}
-    mock_router.return_value.close_ports.assert_called_once()
-
-
-def test_stop_server_missing_returns_error(test_client_no_auth, mock_db):
-    mock_db.get_server.return_value = None
-
-    response = test_client_no_auth.post("/servers/1/stop")
-
-    assert response.status_code == 200
-    assert response.json() == {"success": False}
-
-
-def test_get_server_status_running(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc", id=1)
-    mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_running",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
-    mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_health_status",
-        new_callable=mocker.AsyncMock,
-        return_value="ok",
-    )
+def test_get_server_status_running(test_client_no_auth, patch_db, server_mock, container_client):
+    server_mock()
+    container_client.is_running.return_value = True
+    container_client.health_status.return_value = "ok"
 
     response = test_client_no_auth.get("/servers/1/status")
 
@@ -166,33 +116,12 @@ def test_get_server_status_running(test_client_no_auth, mock_db, mocker):
     assert response.json() == {"running": True, "health": "ok"}
 
 
-def test_get_server_status_missing_server_returns_false(test_client_no_auth, mock_db):
-    mock_db.get_server.return_value = None
-
-    response = test_client_no_auth.get("/servers/1/status")
-
-    assert response.status_code == 200
-    assert response.json() == {"running": False, "health": None}
-
-
-def test_send_command_missing_server_returns_404(test_client_no_auth, mock_db):
-    mock_db.get_server.return_value = None
-
-    response = test_client_no_auth.post("/servers/1/command", params={"command": "say hi"})
-
-    assert response.status_code == 404
-    assert response.json()["detail"] == "Server not found"
-
-
-def test_send_command_invokes_docker_command(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc", id=1)
-    mocker.patch(
-        "server_manager.webservice.routes.server_api.docker_container_send_command",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
+def test_send_command_uses_tenant_namespace(test_client_no_auth, patch_db, server_mock, container_client):
+    server_mock(linked_users=[SimpleNamespace(id=7)])
+    container_client.command.return_value = True
 
     response = test_client_no_auth.post("/servers/1/command", params={"command": "say hi"})
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
+    container_client.command.assert_awaited_once_with("mc", "say hi", namespace="tenant-7")
@@ -1,94 +1,81 @@
-from contextlib import contextmanager
-
-from server_manager.webservice.db_models import TemplatesRead
+from server_manager.webservice.db_models import TemplatesCreate
 from server_manager.webservice.util.data_access import get_db
-from tests.mock_data import TEST_TEMPLATE, TEST_TEMPLATE_READ
-
+from tests.mock_data import TEST_TEMPLATE, TEST_TEMPLATE_READ_MODEL
 
-@contextmanager
-def override_dependency(app, dependency, provider):
-    previous = app.dependency_overrides.get(dependency)
-    app.dependency_overrides[dependency] = provider
-    try:
-        yield
-    finally:
-        if previous is None:
-            app.dependency_overrides.pop(dependency, None)
-        else:
-            app.dependency_overrides[dependency] = previous
+_TEMPLATE_5 = TEST_TEMPLATE_READ_MODEL.model_copy(update={"id": 5})
+_TEMPLATE_10 = TEST_TEMPLATE_READ_MODEL.model_copy(update={"id": 10})
+_TEMPLATE_CREATE = TemplatesCreate(**TEST_TEMPLATE)
 
 
-def test_add_template_success(test_client_no_auth, mock_db, mocker):
-    mocker.patch("server_manager.webservice.routes.template_api.docker_image_exposed_port", return_value=[25565])
-    mock_db.create_template.return_value = TemplatesRead(**TEST_TEMPLATE_READ).model_copy(update={"id": 5})
+def test_add_template_success(test_client_no_auth, mock_db, app_instance):
+    mock_db.create_template.return_value = _TEMPLATE_5
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.post("/templates/", json=TEST_TEMPLATE)
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.post("/templates/", json=TEST_TEMPLATE)
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
-    mock_db.create_template.assert_called_once()
+    mock_db.create_template.assert_called_once_with(_TEMPLATE_CREATE)
 
 
-def test_add_template_returns_false_when_db_fails(test_client_no_auth, mock_db, mocker):
-    mocker.patch("server_manager.webservice.routes.template_api.docker_image_exposed_port", return_value=[25565])
+def test_add_template_returns_false_when_db_fails(test_client_no_auth, mock_db, app_instance):
     mock_db.create_template.return_value = None
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.post("/templates/", json=TEST_TEMPLATE)
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.post("/templates/", json=TEST_TEMPLATE)
 
     assert response.status_code == 200
     assert response.json() == {"success": False}
+    mock_db.create_template.assert_called_once_with(_TEMPLATE_CREATE)
 
 
-def test_get_template_success(test_client_no_auth, mock_db):
-    template = TemplatesRead(**TEST_TEMPLATE_READ).model_copy(update={"id": 10})
-    mock_db.get_template.return_value = template
+def test_get_template_success(test_client_no_auth, mock_db, app_instance):
+    mock_db.get_template.return_value = _TEMPLATE_10
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.get("/templates/10")
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.get("/templates/10")
 
     assert response.status_code == 200
-    assert response.json() == template.model_dump()
+    assert response.content.decode() == _TEMPLATE_10.model_dump_json()
 
 
-def test_get_template_missing_returns_404(test_client_no_auth, mock_db):
+def test_get_template_missing_returns_404(test_client_no_auth, mock_db, app_instance):
     mock_db.get_template.return_value = None
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.get("/templates/22")
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.get("/templates/22")
 
     assert response.status_code == 404
     assert response.json()["detail"] == "Template not found"
 
 
-def test_update_template_success(test_client_no_auth, mock_db, mocker):
-    mocker.patch("server_manager.webservice.routes.template_api.docker_image_exposed_port", return_value=[25565])
-    mock_db.update_template.return_value = TemplatesRead(**TEST_TEMPLATE_READ).model_copy(update={"id": 10})
+def test_update_template_success(test_client_no_auth, mock_db, app_instance):
+    mock_db.update_template.return_value = _TEMPLATE_10
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.patch("/templates/10", json=TEST_TEMPLATE)
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.patch("/templates/10", json=TEST_TEMPLATE)
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
+    mock_db.update_template.assert_called_once_with(10, _TEMPLATE_CREATE)
 
 
-def test_update_template_failure_returns_false(test_client_no_auth, mock_db, mocker):
-    mocker.patch("server_manager.webservice.routes.template_api.docker_image_exposed_port", return_value=[25565])
+def test_update_template_failure_returns_false(test_client_no_auth, mock_db, app_instance):
     mock_db.update_template.return_value = None
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.patch("/templates/10", json=TEST_TEMPLATE)
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.patch("/templates/10", json=TEST_TEMPLATE)
 
     assert response.status_code == 200
     assert response.json() == {"success": False}
+    mock_db.update_template.assert_called_once_with(10, _TEMPLATE_CREATE)
 
 
-def test_delete_template_propagates_result(test_client_no_auth, mock_db):
+def test_delete_template_propagates_result(test_client_no_auth, mock_db, app_instance):
     mock_db.delete_template.return_value = True
 
-    with override_dependency(test_client_no_auth.app, get_db, lambda: mock_db):
-        response = test_client_no_auth.delete("/templates/5/delete", params={"template_id": 5})
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
+    response = test_client_no_auth.delete("/templates/5/delete", params={"template_id": 5})
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
@@ -1,31 +1,52 @@
+import hashlib
 import io
 import tarfile
 from types import SimpleNamespace
 
 import pytest
 
+from server_manager.webservice.util.data_access import get_db
 
-def async_bytes_stream(payload: bytes):
-    async def generator():
-        yield len(payload).to_bytes(8, "big")
-        yield payload
 
-    return generator()
+class AsyncBytesIter:
+    """Async iterator over precomputed chunks, stands in for the generator a volume client returns"""
 
+    __slots__ = ("_chunks", "_i")
 
-def async_zero_stream():
-    async def generator():
-        yield (0).to_bytes(8, "big")
+    def __init__(self, chunks: tuple[bytes, ...]):
+        self._chunks = chunks
+        self._i = 0
 
-    return generator()
+    def __aiter__(self):
+        return self
 
+    async def __anext__(self):
+        if self._i >= len(self._chunks):
+            raise StopAsyncIteration
+        chunk = self._chunks[self._i]
+        self._i += 1
+        return chunk
 
-class DummyTar:
-    def __init__(self, file_bytes: bytes):
-        self._file_bytes = file_bytes
+
+_ZERO_SIZE = (0).to_bytes(8, "big")
+
+
+def _build_tar_once(file_bytes: bytes) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
         info = tarfile.TarInfo(name="file.txt")
         info.size = len(file_bytes)
-        self._member = info
+        tar.addfile(info, io.BytesIO(file_bytes))
+    return buf.getvalue()
+
+
+_TAR_BYTES = _build_tar_once(b"data")
+with tarfile.open(fileobj=io.BytesIO(_TAR_BYTES)) as _tar:
+    _TAR_MEMBERS = _tar.getmembers()
+
+
+class DummyTar:
+    """Archive reader over the prebuilt _TAR_BYTES, members are read from their fixed offsets in the blob"""
 
     def __enter__(self):
         return self
@@ -34,34 +55,54 @@ class DummyTar:
         return False
 
     def getmembers(self):
-        return [self._member]
+        return _TAR_MEMBERS
+
+    def extractfile(self, member):
+        return io.BytesIO(_TAR_BYTES[member.offset_data : member.offset_data + member.size])
+
 
-    def extractfile(self, _member):
-        return io.BytesIO(self._file_bytes)
+def _drain(response, chunk_size: int = 8192):
+    """Consume a streamed response chunk by chunk, returning its byte count and SHA-256 digest"""
+    total = 0
+    digest = hashlib.sha256()
+    for chunk in response.iter_bytes(chunk_size):
+        total += len(chunk)
+        digest.update(chunk)
+    return total, digest.digest()
+
+
+_OWNER = SimpleNamespace(id=7, username="alice")
 
 
 @pytest.fixture(autouse=True)
-def patch_db(mocker, mock_db):
-    mocker.patch("server_manager.webservice.routes.volumes_api.DB", return_value=mock_db)
+def patch_db(app_instance, mock_db):
+    """Serve get_db with mock_db, _isolate_overrides removes it afterwards"""
+    app_instance.dependency_overrides[get_db] = lambda: mock_db
     return mock_db
 
 
-def test_get_archive_streams_filtered_paths(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(template_id=3, container_name="mc")
+def test_get_archive_streams_filtered_paths(test_client_no_auth, mock_db, server_mock, volume_client):
+    server_mock(template_id=3, linked_users=[_OWNER])
     mock_db.get_template.return_value = SimpleNamespace(exposed_volume=["/world", "/config"])
-    mocker.patch(
-        "server_manager.webservice.routes.volumes_api.docker_read_tarfile",
-        new_callable=mocker.AsyncMock,
-        return_value=DummyTar(b"data"),
-    )
+    volume_client.read_archive.return_value = DummyTar()
 
-    response = test_client_no_auth.get("/volumes/1/fs/archive", params={"paths": str(["/world", "/secret"])})
+    with test_client_no_auth.stream(
+        "GET", "/volumes/1/fs/archive", params={"paths": str(["/world", "/secret"])}
+    ) as response:
+        body = response.read()
 
     assert response.status_code == 200
-    assert int(response.headers["Content-Length"]) == len(response.content)
+    assert response.headers["Content-Length"] == str(len(body))
+    # already a gzipped tarball, GZipMiddleware must not compress it again
+    assert "content-encoding" not in response.headers
+    with tarfile.open(fileobj=io.BytesIO(body), mode="r:gz") as archive:
+        assert archive.getnames() == ["file.txt"]
+        assert archive.extractfile("file.txt").read() == b"data"
+    # /secret is not an exposed volume, only /world is read
+    volume_client.read_archive.assert_awaited_once_with(deployment_name="mc", namespace="tenant-7", path="/world")
 
 
-def test_get_archive_missing_server_returns_404(test_client_no_auth, mock_db):
+def test_get_archive_missing_server_returns_404(test_client_no_auth, mock_db, volume_client):
     mock_db.get_server.return_value = None
 
     response = test_client_no_auth.get("/volumes/99/fs/archive")
@@ -70,7 +111,7 @@ def test_get_archive_missing_server_returns_404(test_client_no_auth, mock_db):
     assert response.json()["detail"] == "Server not found"
 
 
-def test_get_archive_without_exposed_volume_returns_400(test_client_no_auth, mock_db):
+def test_get_archive_without_exposed_volume_returns_400(test_client_no_auth, mock_db, volume_client):
     mock_db.get_server.return_value = SimpleNamespace(template_id=3)
     mock_db.get_template.return_value = SimpleNamespace(exposed_volume=None)
 
@@ -80,27 +121,26 @@ def test_get_archive_without_exposed_volume_returns_400(test_client_no_auth, moc
     assert response.json()["detail"] == "No exposed volumes for this server"
 
 
-def test_read_file_returns_tar_stream(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc")
+def test_read_file_returns_tar_stream(test_client_no_auth, server_mock, volume_client):
+    server_mock(linked_users=[_OWNER])
     payload = b"tar-bytes"
-    mocker.patch(
-        "server_manager.webservice.routes.volumes_api.docker_read_file",
-        return_value=async_bytes_stream(payload),
-    )
+    volume_client.read_file.return_value = AsyncBytesIter((len(payload).to_bytes(8, "big"), payload))
 
-    response = test_client_no_auth.get("/volumes/1/fs", params={"path": "/data/config"})
+    with test_client_no_auth.stream("GET", "/volumes/1/fs", params={"path": "data/config"}) as response:
+        total, digest = _drain(response)
 
     assert response.status_code == 200
-    assert response.content == payload
+    assert total == len(payload)
+    assert digest == hashlib.sha256(payload).digest()
     assert response.headers["Content-Length"] == str(len(payload))
+    volume_client.read_file.assert_awaited_once_with(
+        deployment_name="mc", namespace="tenant-7", path="/data/config", username="alice"
+    )
 
 
-def test_read_file_zero_size_returns_500(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc")
-    mocker.patch(
-        "server_manager.webservice.routes.volumes_api.docker_read_file",
-        return_value=async_zero_stream(),
-    )
+def test_read_file_zero_size_returns_500(test_client_no_auth, server_mock, volume_client):
+    server_mock(linked_users=[_OWNER])
+    volume_client.read_file.return_value = AsyncBytesIter((_ZERO_SIZE,))
 
     response = test_client_no_auth.get("/volumes/1/fs", params={"path": "/data/config"})
 
@@ -108,50 +148,45 @@ def test_read_file_zero_size_returns_500(test_client_no_auth, mock_db, mocker):
     assert response.json()["detail"] == "failed to read file size"
 
 
-@pytest.mark.filterwarnings("ignore::DeprecationWarning")
-def test_upload_file_pushes_tar_to_docker(test_client_no_auth, mock_db, mocker):
-    mock_db.get_server.return_value = SimpleNamespace(container_name="mc")
-    docker_upload = mocker.patch(
-        "server_manager.webservice.routes.volumes_api.docker_file_upload",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
+async def test_upload_file_writes_request_body(async_client_no_auth, server_mock, volume_client):
+    server_mock(linked_users=[_OWNER])
+    volume_client.write_file.return_value = True
 
-    response = test_client_no_auth.post(
+    response = await async_client_no_auth.post(
         "/volumes/1/fs/",
-        params={"path": "/data/file.txt"},
-        data=b"payload",
+        params={"path": "data/file.txt"},
+        content=b"payload",
         headers={"Content-Type": "application/octet-stream"},
     )
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
-    docker_upload.assert_awaited_once()
+    volume_client.write_file.assert_awaited_once_with(
+        deployment_name="mc", path="/data/file.txt", data=b"payload", namespace="tenant-7", username="alice"
+    )
 
 
-@pytest.mark.filterwarnings("ignore::DeprecationWarning")
-def test_upload_file_missing_server_returns_404(test_client_no_auth, mock_db):
+async def test_upload_file_missing_server_returns_404(async_client_no_auth, mock_db, volume_client):
     mock_db.get_server.return_value = None
 
-    response = test_client_no_auth.post(
+    response = await async_client_no_auth.post(
         "/volumes/1/fs/",
         params={"path": "/data/file.txt"},
-        data=b"payload",
+        content=b"payload",
         headers={"Content-Type": "application/octet-stream"},
     )
 
     assert response.status_code == 404
     assert response.json()["detail"] == "Server not found"
+    volume_client.write_file.assert_not_awaited()
 
 
-def test_delete_file_calls_docker(test_client_no_auth, mocker):
-    mocker.patch(
-        "server_manager.webservice.routes.volumes_api.docker_delete_file",
-        new_callable=mocker.AsyncMock,
-        return_value=True,
-    )
+def test_delete_file_calls_volume_client(test_client_no_auth, server_mock, volume_client):
+    server_mock(linked_users=[_OWNER])
+    volume_client.delete_file.return_value = True
 
-    response = test_client_no_auth.delete("/volumes/1/fs/some", params={"container_name": "mc", "path": "/some"})
+    response = test_client_no_auth.delete("/volumes/1/fs", params={"path": "/some"})
 
     assert response.status_code == 200
     assert response.json() == {"success": True}
+    volume_client.delete_file.assert_awaited_once_with("mc", "tenant-7", "/some", "alice")
@@ -7,3 +7,14 @@ def test_app_creation(app_instance: FastAPI):
     """
     assert app_instance is not None
     assert isinstance(app_instance, FastAPI)
+
+
+def test_app_has_no_base_http_middleware(app_instance: FastAPI):
+    """
+    Tests that every middleware is pure ASGI; BaseHTTPMiddleware (and @app.middleware("http")) adds a task and
+    a Request/Response pair to every request.
+    """
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    for middleware in app_instance.user_middleware:
+        assert not (isinstance(middleware.cls, type) and issubclass(middleware.cls, BaseHTTPMiddleware))
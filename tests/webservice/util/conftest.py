@@ -0,0 +1,21 @@
+import pytest
+
+from server_manager.webservice.util.auth import create_access_token, get_password_hash
+
+
+@pytest.fixture(scope="session")
+def correct_password_hash() -> str:
+    """bcrypt hash of "correctpassword", computed once per session for tests that need a known-good hash"""
+    return get_password_hash("correctpassword")
+
+
+@pytest.fixture(scope="session")
+def testpassword_hash() -> str:
+    """bcrypt hash of "testpassword", computed once per session"""
+    return get_password_hash("testpassword")
+
+
+@pytest.fixture(scope="module")
+def testuser_token() -> str:
+    """Access token for "testuser" with the default expiry, created once per module"""
+    return create_access_token({"sub": "testuser"})
@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm, SecurityScopes
 
 from server_manager.webservice.db_models import Users, UsersRead
+from server_manager.webservice.util import auth as _auth_mod
 from server_manager.webservice.util.auth import (
     _ALGORITHM,
     auth_aquire_token,
@@ -17,12 +18,25 @@ from server_manager.webservice.util.auth import (
     create_access_token,
     create_user,
     get_key,
-    get_password_hash,
+    oauth2_wrapper,
     secure_scope,
     verify_password,
     verify_token,
 )
 
+_CREDENTIALS_EXCEPTION = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_SS_ME = SecurityScopes(scopes=["management.me"])
+_SS_EMPTY = SecurityScopes(scopes=[])
+
+
+@pytest.fixture(scope="module")
+def oauth_form():
+    return OAuth2PasswordRequestForm(username="user", password="pw", scope="")
+
 
 @pytest.fixture
 def setup_secret_key(monkeypatch):
@@ -32,25 +46,22 @@ def setup_secret_key(monkeypatch):
     monkeypatch.delenv("SM_SECRET_KEY", raising=False)
 
 
-def test_password_hashing_and_verification():
+def test_password_hashing_and_verification(testpassword_hash):
     """
     Tests that password hashing and verification work correctly.
     """
     password = "testpassword"
-    hashed_password = get_password_hash(password)
-    assert hashed_password != password
-    assert verify_password(password, hashed_password)
-    assert not verify_password("wrongpassword", hashed_password)
+    assert testpassword_hash != password
+    assert verify_password(password, testpassword_hash)
+    assert not verify_password("wrongpassword", testpassword_hash)
 
 
 @pytest.mark.usefixtures("setup_secret_key")
-def test_create_access_token():
+def test_create_access_token(testuser_token):
     """
     Tests the creation of a JWT access token.
     """
-    data = {"sub": "testuser"}
-    token = create_access_token(data)
-    decoded_token = jwt.decode(token, get_key(), algorithms=[_ALGORITHM])
+    decoded_token = jwt.decode(testuser_token, get_key(), algorithms=[_ALGORITHM])
     assert decoded_token["sub"] == "testuser"
     assert "exp" in decoded_token
 
@@ -64,17 +75,16 @@ def test_verify_password_invalid_hash():
     assert not verify_password(password, invalid_hashed_password)
 
 
-def test_auth_user_success(mocker, monkeypatch):
+def test_auth_user_success(mocker, monkeypatch, correct_password_hash):
     """
     Tests that auth_user returns the user when authentication is successful.
     """
 
     mock_db_instance = mocker.MagicMock()
-    mock_user = mocker.MagicMock()
-    mock_user.hashed_password = get_password_hash("correctpassword")
+    mock_user = SimpleNamespace(hashed_password=correct_password_hash)
     mock_db_instance.lookup_username.return_value = mock_user
 
-    monkeypatch.setattr("server_manager.webservice.util.auth.DB", lambda: mock_db_instance)
+    monkeypatch.setattr(_auth_mod, "DB", lambda: mock_db_instance)
 
     result = auth_user("testuser", "correctpassword")
 
@@ -89,7 +99,7 @@ def test_auth_user_not_found(mocker, monkeypatch):
     mock_db_instance = mocker.MagicMock()
     mock_db_instance.lookup_username.return_value = None
 
-    monkeypatch.setattr("server_manager.webservice.util.auth.DB", lambda: mock_db_instance)
+    monkeypatch.setattr(_auth_mod, "DB", lambda: mock_db_instance)
 
     result = auth_user("nonexistentuser", "somepassword")
 
@@ -105,11 +115,11 @@ def test_user_disabled_by_default(mocker, monkeypatch):
     mock_db_instance = mocker.MagicMock()
 
     def mock_create_user_func(user, password):
-        return UsersRead(id=1, **user.model_dump())
+        return UsersRead.model_construct(id=1, **user.__dict__)
 
     mock_db_instance.create_user.side_effect = mock_create_user_func
 
-    monkeypatch.setattr("server_manager.webservice.util.auth.DB", lambda: mock_db_instance)
+    monkeypatch.setattr(_auth_mod, "DB", lambda: mock_db_instance)
 
     username = "newuser"
     password = "newpassword"
@@ -124,69 +134,55 @@ def test_user_disabled_by_default(mocker, monkeypatch):
 
 
 @pytest.mark.usefixtures("setup_secret_key")
-def test_create_access_token_with_expiry():
+def test_create_access_token_with_expiry(monkeypatch):
     """
     Tests the creation of a JWT access token with a specific expiry time.
     """
+    frozen_now = datetime.now(UTC).replace(microsecond=0)
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, _tz=None):
+            return frozen_now
+
+    monkeypatch.setattr(_auth_mod, "datetime", _FrozenDatetime)
     data = {"sub": "testuser"}
     expires_delta = timedelta(minutes=30)
     token = create_access_token(data, expired_delta=expires_delta)
     decoded_token = jwt.decode(token, get_key(), algorithms=[_ALGORITHM])
-    expire = decoded_token["exp"]
-    expected_expire = datetime.now(UTC) + expires_delta
 
-    assert abs(datetime.fromtimestamp(expire, tz=UTC) - expected_expire) < timedelta(seconds=5)
+    assert decoded_token["exp"] == int((frozen_now + expires_delta).timestamp())
 
 
 @pytest.mark.usefixtures("setup_secret_key")
-def test_verify_token_valid():
+def test_verify_token_valid(testuser_token):
     """
-    Tests that a valid token is verified correctly.
+    Tests that verify_token returns the payload of a valid token.
     """
-    username = "testuser"
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    token = create_access_token(data={"sub": username})
-    payload = verify_token(token, credentials_exception=credentials_exception)
-    assert payload.get("sub") == username
+    payload = verify_token(testuser_token, credentials_exception=_CREDENTIALS_EXCEPTION)
+    assert payload.get("sub") == "testuser"
 
 
+@pytest.mark.usefixtures("setup_secret_key")
 def test_verify_token_expired():
     """
-    Tests that an expired token raises an HTTPException.
+    Tests that verify_token rejects an expired token.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     token = create_access_token(data={"sub": "testuser"}, expired_delta=timedelta(seconds=-1))
     with pytest.raises(HTTPException) as excinfo:
-        verify_token(token, credentials_exception=credentials_exception)
+        verify_token(token, credentials_exception=_CREDENTIALS_EXCEPTION)
     assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_verify_token_invalid(monkeypatch):
+@pytest.mark.parametrize("secret_override", [None, ""], ids=["configured_key", "empty_key"])
+def test_verify_token_invalid(monkeypatch, secret_override):
     """
-    Tests that an invalid token raises an HTTPException.
+    Tests that a malformed token is rejected, including when the secret key is empty.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    token = "thisisnotavalidtoken"
-    with pytest.raises(HTTPException) as excinfo:
-        verify_token(token, credentials_exception=credentials_exception)
-    assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
-
-    monkeypatch.setattr("server_manager.webservice.util.auth.get_key", lambda: "")
+    if secret_override is not None:
+        monkeypatch.setattr(_auth_mod, "get_key", lambda: secret_override)
     with pytest.raises(HTTPException) as excinfo:
-        verify_token(token, credentials_exception=credentials_exception)
+        verify_token("thisisnotavalidtoken", credentials_exception=_CREDENTIALS_EXCEPTION)
     assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
@@ -197,56 +193,54 @@ def test_secure_scope_with_and_without_scopes():
     extra = object()
     scoped = secure_scope([], dependencies=[extra])
     assert scoped["dependencies"][-1] is extra
+    # the shared wrapper is not mutated
+    assert extra not in oauth2_wrapper["dependencies"]
 
 
-@pytest.mark.asyncio
-async def test_auth_get_user_success(monkeypatch, mocker):
+async def test_auth_get_user_success(monkeypatch):
     user = UsersRead(id=1, username="user", scopes=["management.me"], disabled=False, admin=False)
-    mock_db = mocker.MagicMock()
-    mock_db.lookup_username.return_value = user
-    monkeypatch.setattr("server_manager.webservice.util.auth.DB", lambda: mock_db)
+    mock_db = SimpleNamespace(lookup_username=lambda _username: user)
+    monkeypatch.setattr(_auth_mod, "DB", lambda: mock_db)
     monkeypatch.setattr(
-        "server_manager.webservice.util.auth.verify_token",
+        _auth_mod,
+        "verify_token",
         lambda token, credentials_exception: {"sub": "user", "scopes": ["management.me"], "exp": 9999999999},
     )
 
-    result = await auth_get_user(SecurityScopes(scopes=["management.me"]), token="token")
+    result = await auth_get_user(_SS_ME, token="token")
 
     assert result is user
 
 
-@pytest.mark.asyncio
-async def test_auth_get_user_missing_scope(monkeypatch, mocker):
+async def test_auth_get_user_missing_scope(monkeypatch):
     user = UsersRead(id=1, username="user", scopes=["basic"], disabled=False, admin=False)
-    mock_db = mocker.MagicMock()
-    mock_db.lookup_username.return_value = user
-    monkeypatch.setattr("server_manager.webservice.util.auth.DB", lambda: mock_db)
+    mock_db = SimpleNamespace(lookup_username=lambda _username: user)
+    monkeypatch.setattr(_auth_mod, "DB", lambda: mock_db)
     monkeypatch.setattr(
-        "server_manager.webservice.util.auth.verify_token",
+        _auth_mod,
+        "verify_token",
         lambda token, credentials_exception: {"sub": "user", "scopes": ["basic"], "exp": 9999999999},
     )
 
     with pytest.raises(HTTPException) as exc:
-        await auth_get_user(SecurityScopes(scopes=["management.me"]), token="token")
+        await auth_get_user(_SS_ME, token="token")
 
     assert exc.value.detail == "Not enough permissions"
 
 
-@pytest.mark.asyncio
-async def test_auth_get_user_missing_user(monkeypatch, mocker):
-    mock_db = mocker.MagicMock()
-    mock_db.lookup_username.return_value = None
-    monkeypatch.setattr("server_manager.webservice.util.auth.DB", lambda: mock_db)
+async def test_auth_get_user_missing_user(monkeypatch):
+    mock_db = SimpleNamespace(lookup_username=lambda _username: None)
+    monkeypatch.setattr(_auth_mod, "DB", lambda: mock_db)
     monkeypatch.setattr(
-        "server_manager.webservice.util.auth.verify_token",
+        _auth_mod,
+        "verify_token",
         lambda token, credentials_exception: {"sub": "ghost", "scopes": []},
     )
 
     with pytest.raises(HTTPException):
-        await auth_get_user(SecurityScopes(scopes=[]), token="token")
+        await auth_get_user(_SS_EMPTY, token="token")
 
 
-@pytest.mark.asyncio
 async def test_auth_get_active_user_rejects_disabled():
     user = UsersRead(id=1, username="user", scopes=[], disabled=True, admin=False)
 
@@ -254,22 +248,18 @@ async def test_auth_get_active_user_rejects_disabled():
         await auth_get_active_user(cast(Users, user))
 
 
-@pytest.mark.asyncio
-async def test_auth_aquire_access_token_success(monkeypatch):
+async def test_auth_aquire_access_token_success(monkeypatch, oauth_form):
     user = SimpleNamespace(username="user", scopes=["scope"], disabled=False)
-    monkeypatch.setattr("server_manager.webservice.util.auth.auth_user", lambda u, p: user)
+    monkeypatch.setattr(_auth_mod, "auth_user", lambda u, p: user)
 
-    form = OAuth2PasswordRequestForm(username="user", password="pw", scope="")
-    token = await auth_aquire_token(form)
+    token = await auth_aquire_token(oauth_form)
 
     assert token.access_token.token_type == "bearer"
     assert token.access_token
 
 
-@pytest.mark.asyncio
-async def test_auth_aquire_access_token_invalid(monkeypatch):
-    monkeypatch.setattr("server_manager.webservice.util.auth.auth_user", lambda u, p: False)
+async def test_auth_aquire_access_token_invalid(monkeypatch, oauth_form):
+    monkeypatch.setattr(_auth_mod, "auth_user", lambda u, p: False)
 
-    form = OAuth2PasswordRequestForm(username="user", password="pw", scope="")
     with pytest.raises(HTTPException):
-        await auth_aquire_token(form)
+        await auth_aquire_token(oauth_form)
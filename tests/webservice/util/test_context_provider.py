@@ -22,7 +22,6 @@ def mock_docker_client(mocker: MockerFixture) -> MagicMock:
     return mock_client_instance
 
 
-@pytest.mark.asyncio
 async def test_docker_container_success(mock_docker_client: MagicMock):
     """Test the success path of the docker_container context manager."""
     # Act
@@ -35,7 +34,6 @@ async def test_docker_container_success(mock_docker_client: MagicMock):
         mock_docker_client.containers.get.assert_awaited_once_with("mock-container")
 
 
-@pytest.mark.asyncio
 async def test_docker_container_failure_not_found(mock_docker_client: MagicMock):
     """Test the failure path when a container is not found."""
     # Arrange
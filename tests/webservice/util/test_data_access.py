@@ -1,26 +1,19 @@
+from contextlib import nullcontext
 from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlmodel import Session
 
 from server_manager.webservice.db_models import NodesCreate, ServersCreate, TemplatesCreate, UsersCreate
+from server_manager.webservice.util import data_access
 from server_manager.webservice.util.data_access import DB, get_db
 from server_manager.webservice.util.singleton import SingletonMeta
 
 
-class _SessionContext:
-    def __init__(self, session):
-        self._session = session
-
-    def __enter__(self):
-        return self._session
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
-
 @pytest.fixture(autouse=True)
 def reset_singleton():
     SingletonMeta._instances.pop(DB, None)
@@ -28,22 +21,74 @@ def reset_singleton():
     SingletonMeta._instances.pop(DB, None)
 
 
+@pytest.fixture(scope="module")
+def _db_env():
+    """Env vars and engine/metadata patches shared by every db_with_session test in this module"""
+    engine = object()
+    with (
+        pytest.MonkeyPatch.context() as mp,
+        patch.object(data_access, "create_engine", return_value=engine),
+        patch.object(data_access.SQLModel.metadata, "create_all"),
+        patch.object(data_access.SQLModel.metadata, "drop_all") as drop_all,
+    ):
+        mp.setenv("SM_DB_CONNECTION", "sqlite:///:memory:")
+        mp.setenv("SM_PORT_START", "27015")
+        mp.setenv("SM_PORT_END", "27020")
+        yield engine, drop_all
+
+
+@pytest.fixture(scope="module")
+def _session_template():
+    """One Session-specced mock for the whole module, reset by session_mock before each test"""
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture(scope="module")
+def _session_context(_session_template):
+    """Reusable `with Session(...)` stand-in yielding the shared session mock"""
+    return nullcontext(_session_template)
+
+
 @pytest.fixture
-def db_with_session(mocker, monkeypatch):
-    monkeypatch.setenv("SM_DB_CONNECTION", "sqlite:///:memory:")
-    monkeypatch.setenv("SM_PORT_START", "27015")
-    monkeypatch.setenv("SM_PORT_END", "27020")
+def session_mock(_session_template):
+    _session_template.reset_mock(return_value=True, side_effect=True)
+    return _session_template
 
-    engine = object()
-    mocker.patch("server_manager.webservice.util.data_access.create_engine", return_value=engine)
-    mocker.patch("server_manager.webservice.util.data_access.SQLModel.metadata.create_all")
-    drop_all = mocker.patch("server_manager.webservice.util.data_access.sqlmodel.SQLModel.metadata.drop_all")
 
-    session = mocker.MagicMock()
-    mocker.patch("server_manager.webservice.util.data_access.Session", return_value=_SessionContext(session))
+@pytest.fixture
+def db_with_session(_db_env, session_mock, _session_context, monkeypatch):
+    engine, drop_all = _db_env
+    drop_all.reset_mock()
+
+    monkeypatch.setattr(data_access, "Session", lambda *_args, **_kwargs: _session_context)
 
     db = DB()
-    return db, session, engine, drop_all
+    return db, session_mock, engine, drop_all
+
+
+def test_engine_uses_pre_ping_pool(mocker, monkeypatch):
+    monkeypatch.setenv("SM_DB_CONNECTION", "postgresql://localhost/sm")
+    create_engine = mocker.patch("server_manager.webservice.util.data_access.create_engine")
+    mocker.patch("server_manager.webservice.util.data_access.SQLModel.metadata.create_all")
+
+    DB().dispose()
+
+    _, kwargs = create_engine.call_args
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_size"] > 0
+    create_engine.return_value.dispose.assert_called_once_with()
+
+
+def test_engine_skips_pool_options_for_sqlite(mocker, monkeypatch):
+    monkeypatch.setenv("SM_DB_CONNECTION", "sqlite:///sm.db")
+    create_engine = mocker.patch("server_manager.webservice.util.data_access.create_engine")
+    mocker.patch("server_manager.webservice.util.data_access.SQLModel.metadata.create_all")
+
+    DB().dispose()
+
+    _, kwargs = create_engine.call_args
+    assert "pool_size" not in kwargs
+    assert "pool_pre_ping" not in kwargs
 
 
 def test_create_user_forces_non_admin(db_with_session):
@@ -155,45 +200,54 @@ def test_get_db_yields_singleton_instance(db_with_session):
         next(generator)
 
 
+_SERVER_PAYLOAD = ServersCreate(
+    name="srv",
+    env={"A": "1"},
+    cpu=1,
+    disk=10,
+    memory=2,
+    container_name="srv-container",
+    node_id=1,
+    template_id=2,
+    tags=["prod"],
+)
+
+
 def _sample_server_payload():
-    return ServersCreate(
-        name="srv",
-        env={"A": "1"},
-        cpu=1,
-        disk=10,
-        memory=2,
-        container_name="srv-container",
-        node_id=1,
-        template_id=2,
-        tags=["prod"],
-    )
+    return _SERVER_PAYLOAD
+
+
+_TEMPLATE_PAYLOAD = TemplatesCreate(
+    name="temp",
+    image="repo/image:latest",
+    tags=["latest"],
+    exposed_port=[25565],
+    exposed_volume=["/data"],
+    modules=["base"],
+    description="desc",
+    resource_min_cpu=1,
+    resource_min_disk=10,
+    resource_min_mem=2,
+)
 
 
 def _sample_template_payload():
-    return TemplatesCreate(
-        name="temp",
-        image="repo/image:latest",
-        tags=["latest"],
-        exposed_port=[25565],
-        exposed_volume=["/data"],
-        modules=["base"],
-        description="desc",
-        resource_min_cpu=1,
-        resource_min_disk=10,
-        resource_min_mem=2,
-    )
+    return _TEMPLATE_PAYLOAD
+
+
+_NODE_PAYLOAD = NodesCreate(
+    name="node",
+    cpus=8,
+    disk=100,
+    memory=32,
+    cpu_name="Test CPU",
+    max_hz=3600,
+    arch="x86_64",
+)
 
 
 def _sample_node_payload():
-    return NodesCreate(
-        name="node",
-        cpus=8,
-        disk=100,
-        memory=32,
-        cpu_name="Test CPU",
-        max_hz=3600,
-        arch="x86_64",
-    )
+    return _NODE_PAYLOAD
 
 
 def _template_validation_error() -> ValidationError:
@@ -212,6 +266,9 @@ def _template_validation_error() -> ValidationError:
     raise AssertionError(msg)
 
 
+_TEMPLATE_VALIDATION_ERROR = _template_validation_error()
+
+
 def test_create_server_returns_refreshed_instance(db_with_session):
     db, session, *_ = db_with_session
     session.refresh.side_effect = lambda obj: setattr(obj, "id", 7)
@@ -298,7 +355,7 @@ def test_create_template_handles_validation_error(db_with_session, mocker):
     db, session, *_ = db_with_session
     mocker.patch(
         "server_manager.webservice.util.data_access.Templates.model_validate",
-        side_effect=_template_validation_error(),
+        side_effect=_TEMPLATE_VALIDATION_ERROR,
     )
 
     with pytest.raises(HTTPException) as exc:
@@ -320,7 +377,7 @@ def test_update_template_success_and_failure(db_with_session, mocker):
 
     mocker.patch(
         "server_manager.webservice.util.data_access.TemplatesCreate.model_copy",
-        side_effect=_template_validation_error(),
+        side_effect=_TEMPLATE_VALIDATION_ERROR,
     )
 
     assert db.update_template(1, template, description="other") is None
@@ -358,6 +415,3 @@ def test_node_helpers_cover_all_branches(db_with_session):
     assert db.get_users() == ["user"]
     assert db.delete_node(1) is True
     assert db.delete_node(2) is False
-
-
-# filepath: /home/wsl/Textual/server-manager/builder/SM-Backend/tests/util/test_data_access.py
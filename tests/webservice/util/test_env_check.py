@@ -1,27 +1,35 @@
+import os
+
 import pytest
 
 from server_manager.webservice.util.env_check import check_mount_path
 
 
-def test_check_mount_path_bad_access(monkeypatch):
-    monkeypatch.setenv("SM_MOUNT_PATH", "/tmp/server_manager_test_mount")
-    monkeypatch.setattr("os.access", lambda _path, _mode: False)
-    with pytest.raises(SystemExit, match="1") as exc_info:
-        check_mount_path()
-    assert exc_info.value.code == 1
+def _deny(*_args, **_kwargs):
+    raise PermissionError
+
 
+def test_check_mount_path_writable(monkeypatch, tmp_path):
+    monkeypatch.setenv("SM_MOUNT_PATH", str(tmp_path))
 
-def test_check_mount_path_good_access(monkeypatch):
-    monkeypatch.setenv("SM_MOUNT_PATH", "/tmp/server_manager_test_mount")
-    monkeypatch.setattr("os.access", lambda _path, _mode: True)
     # Should not raise any exception
     check_mount_path()
+    # The write probe is cleaned up
+    assert os.listdir(tmp_path) == []
+
+
+def test_check_mount_path_unwritable_exits(monkeypatch, tmp_path):
+    monkeypatch.setenv("SM_MOUNT_PATH", str(tmp_path))
+    monkeypatch.setattr("os.open", _deny)
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_mount_path()
+    assert exc_info.value.code == 1
 
 
 def test_check_mount_path_creates_directory(monkeypatch, tmp_path):
     test_mount_path = tmp_path / "server_manager_test_mount"
     monkeypatch.setenv("SM_MOUNT_PATH", str(test_mount_path))
-    monkeypatch.setattr("os.access", lambda _path, _mode: True)
 
     # Ensure the directory does not exist before the check
     assert not test_mount_path.exists()
@@ -32,3 +40,14 @@ def test_check_mount_path_creates_directory(monkeypatch, tmp_path):
     # Verify that the directory was created
     assert test_mount_path.exists()
     assert test_mount_path.is_dir()
+
+
+def test_check_mount_path_resolves_once(monkeypatch, tmp_path):
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    monkeypatch.setenv("SM_MOUNT_PATH", str(tmp_path / "link"))
+
+    resolved = check_mount_path()
+
+    assert resolved == os.path.realpath(tmp_path / "real")
+    assert os.environ["SM_MOUNT_PATH"] == resolved